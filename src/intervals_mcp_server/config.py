@@ -19,7 +19,7 @@ except ImportError:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Configuration settings for the Intervals.icu MCP Server."""
 
@@ -67,6 +67,7 @@ def get_config() -> Config:
         Config: The configuration instance.
     """
     global _config_instance  # pylint: disable=global-statement  # noqa: PLW0603 - singleton pattern
-    if _config_instance is None:
-        _config_instance = load_config()
-    return _config_instance
+    config = _config_instance
+    if config is None:
+        config = _config_instance = load_config()
+    return config
@@ -6,7 +6,7 @@ This module contains formatting functions for handling data from the Intervals.i
 
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 
 
 class _KeyTracker(dict):
@@ -30,25 +30,55 @@ class _KeyTracker(dict):
         return super().__contains__(key)
 
 
-def format_activity_summary(activity: dict[str, Any]) -> str:
-    """Format an activity into a readable string."""
-    start_time = activity.get("startTime", activity.get("start_date", "Unknown"))
+# Sentinel distinguishing "key absent from the payload" from a present None.
+_MISSING: Any = object()
 
+
+def format_activity_summary(activity: dict[str, Any], skip_missing: bool = False) -> str:
+    """Format an activity into a readable string.
+
+    Args:
+        activity: Activity data from the Intervals.icu API.
+        skip_missing: If True, omit lines whose value is absent from the
+            payload (and section headers whose lines were all omitted) instead
+            of rendering "N/A"/0 placeholders. Shrinks the response for
+            sparse activities (default False).
+    """
+
+    def first(*keys: str) -> Any:
+        """Return the value of the first key present in the activity."""
+        for key in keys:
+            if key in activity:
+                return activity[key]
+        return _MISSING
+
+    def line(label: str, value: Any, default: Any = "N/A", suffix: str = "") -> str | None:
+        """Render one "label: value" line, or None when the line is skipped."""
+        if value is _MISSING:
+            if skip_missing:
+                return None
+            value = default
+        elif skip_missing and (value is None or value == "N/A"):
+            return None
+        return f"{label}: {value}{suffix}"
+
+    start_time = first("startTime", "start_date")
     if isinstance(start_time, str) and len(start_time) > 10:
-        # Format datetime if it's a full ISO string
+        # Format datetime if it's a full ISO string. fromisoformat handles the
+        # trailing "Z" natively on Python 3.11+, so no replace() copy is needed.
         try:
-            dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(start_time)
             start_time = dt.strftime("%Y-%m-%d %H:%M:%S")
         except ValueError:
             pass
 
     rpe = activity.get("perceived_exertion", None)
     if rpe is None:
-        rpe = activity.get("icu_rpe", "N/A")
+        rpe = activity.get("icu_rpe", _MISSING)
     if isinstance(rpe, (int, float)):
         rpe = f"{rpe}/10"
 
-    feel = activity.get("feel", "N/A")
+    feel = activity.get("feel", _MISSING)
     if isinstance(feel, int):
         feel = f"{feel}/5"
 
@@ -62,85 +92,126 @@ def format_activity_summary(activity: dict[str, Any]) -> str:
     if resolved_name:
         gear_name = resolved_name
         if isinstance(gear_raw, dict):
-            gear_id = gear_raw.get("id", activity.get("gear_id", "N/A"))
+            gear_id = gear_raw.get("id", activity.get("gear_id", _MISSING))
         else:
-            gear_id = activity.get("gear_id", "N/A")
+            gear_id = activity.get("gear_id", _MISSING)
     elif isinstance(gear_raw, dict):
-        gear_name = gear_raw.get("name") or gear_raw.get("display_name") or "N/A"
-        gear_id = gear_raw.get("id", "N/A")
+        gear_name = gear_raw.get("name") or gear_raw.get("display_name") or _MISSING
+        gear_id = gear_raw.get("id", _MISSING)
     else:
-        gear_name = activity.get("gear_name", "N/A")
-        gear_id = activity.get("gear_id", "N/A")
-
-    return f"""
-Activity: {activity.get("name", "Unnamed")}
-ID: {activity.get("id", "N/A")}
-Type: {activity.get("type", "Unknown")}
-Date: {start_time}
-Description: {activity.get("description", "N/A")}
-Distance: {activity.get("distance", 0)} meters
-Duration: {activity.get("duration", activity.get("elapsed_time", 0))} seconds
-Moving Time: {activity.get("moving_time", "N/A")} seconds
-Elevation Gain: {activity.get("elevationGain", activity.get("total_elevation_gain", 0))} meters
-Elevation Loss: {activity.get("total_elevation_loss", "N/A")} meters
-
-Power Data:
-Average Power: {activity.get("avgPower", activity.get("icu_average_watts", activity.get("average_watts", "N/A")))} watts
-Weighted Avg Power: {activity.get("icu_weighted_avg_watts", "N/A")} watts
-Training Load: {activity.get("trainingLoad", activity.get("icu_training_load", "N/A"))}
-FTP: {activity.get("icu_ftp", "N/A")} watts
-Kilojoules: {activity.get("icu_joules", "N/A")}
-Intensity: {activity.get("icu_intensity", "N/A")}
-Power:HR Ratio: {activity.get("icu_power_hr", "N/A")}
-Variability Index: {activity.get("icu_variability_index", "N/A")}
-
-Heart Rate Data:
-Average Heart Rate: {activity.get("avgHr", activity.get("average_heartrate", "N/A"))} bpm
-Max Heart Rate: {activity.get("max_heartrate", "N/A")} bpm
-LTHR: {activity.get("lthr", "N/A")} bpm
-Resting HR: {activity.get("icu_resting_hr", "N/A")} bpm
-Decoupling: {activity.get("decoupling", "N/A")}
-
-Other Metrics:
-Cadence: {activity.get("average_cadence", "N/A")} rpm
-Calories burned: {activity.get("calories", "N/A")} kcal
-Average Speed: {activity.get("average_speed", "N/A")} m/s
-Max Speed: {activity.get("max_speed", "N/A")} m/s
-Average Stride: {activity.get("average_stride", "N/A")}
-L/R Balance: {activity.get("avg_lr_balance", "N/A")}
-Weight: {activity.get("icu_weight", "N/A")} kg
-RPE: {rpe}
-Session RPE: {activity.get("session_rpe", "N/A")}
-Feel: {feel}
-
-Environment:
-Trainer: {activity.get("trainer", "N/A")}
-Average Temp: {activity.get("average_temp", "N/A")}°C
-Min Temp: {activity.get("min_temp", "N/A")}°C
-Max Temp: {activity.get("max_temp", "N/A")}°C
-Avg Wind Speed: {activity.get("average_wind_speed", "N/A")} km/h
-Headwind %: {activity.get("headwind_percent", "N/A")}%
-Tailwind %: {activity.get("tailwind_percent", "N/A")}%
-
-Training Metrics:
-Fitness (CTL): {activity.get("icu_ctl", "N/A")}
-Fatigue (ATL): {activity.get("icu_atl", "N/A")}
-TRIMP: {activity.get("trimp", "N/A")}
-Polarization Index: {activity.get("polarization_index", "N/A")}
-Power Load: {activity.get("power_load", "N/A")}
-HR Load: {activity.get("hr_load", "N/A")}
-Pace Load: {activity.get("pace_load", "N/A")}
-Efficiency Factor: {activity.get("icu_efficiency_factor", "N/A")}
-
-Device Info:
-Device: {activity.get("device_name", "N/A")}
-Power Meter: {activity.get("power_meter", "N/A")}
-File Type: {activity.get("file_type", "N/A")}
-
-Gear:
-Name: {gear_name}
-ID: {gear_id}
-"""
+        gear_name = activity.get("gear_name", _MISSING)
+        gear_id = activity.get("gear_id", _MISSING)
+
+    # Each section is a header plus its lines; a None line was skipped, and a
+    # section whose lines were all skipped is dropped along with its header.
+    sections: list[tuple[str | None, list[str | None]]] = [
+        (
+            None,
+            [
+                line("Activity", first("name"), "Unnamed"),
+                line("ID", first("id")),
+                line("Type", first("type"), "Unknown"),
+                line("Date", start_time, "Unknown"),
+                line("Description", first("description")),
+                line("Distance", first("distance"), 0, " meters"),
+                line("Duration", first("duration", "elapsed_time"), 0, " seconds"),
+                line("Moving Time", first("moving_time"), suffix=" seconds"),
+                line("Elevation Gain", first("elevationGain", "total_elevation_gain"), 0, " meters"),
+                line("Elevation Loss", first("total_elevation_loss"), suffix=" meters"),
+            ],
+        ),
+        (
+            "Power Data:",
+            [
+                line("Average Power", first("avgPower", "icu_average_watts", "average_watts"), suffix=" watts"),
+                line("Weighted Avg Power", first("icu_weighted_avg_watts"), suffix=" watts"),
+                line("Training Load", first("trainingLoad", "icu_training_load")),
+                line("FTP", first("icu_ftp"), suffix=" watts"),
+                line("Kilojoules", first("icu_joules")),
+                line("Intensity", first("icu_intensity")),
+                line("Power:HR Ratio", first("icu_power_hr")),
+                line("Variability Index", first("icu_variability_index")),
+            ],
+        ),
+        (
+            "Heart Rate Data:",
+            [
+                line("Average Heart Rate", first("avgHr", "average_heartrate"), suffix=" bpm"),
+                line("Max Heart Rate", first("max_heartrate"), suffix=" bpm"),
+                line("LTHR", first("lthr"), suffix=" bpm"),
+                line("Resting HR", first("icu_resting_hr"), suffix=" bpm"),
+                line("Decoupling", first("decoupling")),
+            ],
+        ),
+        (
+            "Other Metrics:",
+            [
+                line("Cadence", first("average_cadence"), suffix=" rpm"),
+                line("Calories burned", first("calories"), suffix=" kcal"),
+                line("Average Speed", first("average_speed"), suffix=" m/s"),
+                line("Max Speed", first("max_speed"), suffix=" m/s"),
+                line("Average Stride", first("average_stride")),
+                line("L/R Balance", first("avg_lr_balance")),
+                line("Weight", first("icu_weight"), suffix=" kg"),
+                line("RPE", rpe),
+                line("Session RPE", first("session_rpe")),
+                line("Feel", feel),
+            ],
+        ),
+        (
+            "Environment:",
+            [
+                line("Trainer", first("trainer")),
+                line("Average Temp", first("average_temp"), suffix="°C"),
+                line("Min Temp", first("min_temp"), suffix="°C"),
+                line("Max Temp", first("max_temp"), suffix="°C"),
+                line("Avg Wind Speed", first("average_wind_speed"), suffix=" km/h"),
+                line("Headwind %", first("headwind_percent"), suffix="%"),
+                line("Tailwind %", first("tailwind_percent"), suffix="%"),
+            ],
+        ),
+        (
+            "Training Metrics:",
+            [
+                line("Fitness (CTL)", first("icu_ctl")),
+                line("Fatigue (ATL)", first("icu_atl")),
+                line("TRIMP", first("trimp")),
+                line("Polarization Index", first("polarization_index")),
+                line("Power Load", first("power_load")),
+                line("HR Load", first("hr_load")),
+                line("Pace Load", first("pace_load")),
+                line("Efficiency Factor", first("icu_efficiency_factor")),
+            ],
+        ),
+        (
+            "Device Info:",
+            [
+                line("Device", first("device_name")),
+                line("Power Meter", first("power_meter")),
+                line("File Type", first("file_type")),
+            ],
+        ),
+        (
+            "Gear:",
+            [
+                line("Name", gear_name),
+                line("ID", gear_id),
+            ],
+        ),
+    ]
+
+    # Empty strings produce the section-separating blank lines (and the
+    # leading/trailing newlines); the parts are joined once at the end.
+    lines: list[str] = [""]
+    for header, body in sections:
+        rows = [row for row in body if row is not None]
+        if not rows:
+            continue
+        if header is not None:
+            lines.append(header)
+        lines.extend(rows)
+        lines.append("")
+    return "\n".join(lines)
 
 
 def format_workout(workout: dict[str, Any]) -> str:
@@ -155,16 +226,58 @@ Intervals: {len(workout.get("intervals", []))}
 """
 
 
+# Per-field specs for the wellness sections, hoisted to module scope so the
+# helpers don't rebuild the list (and its nested tuples) on every entry.
+_TRAINING_METRICS_SPEC: tuple[tuple[str, str], ...] = (
+    ("ctl", "Fitness (CTL)"),
+    ("atl", "Fatigue (ATL)"),
+    ("rampRate", "Ramp Rate"),
+    ("ctlLoad", "CTL Load"),
+    ("atlLoad", "ATL Load"),
+)
+
+_VITAL_SIGNS_SPEC: tuple[tuple[str, str, str], ...] = (
+    ("weight", "Weight", "kg"),
+    ("restingHR", "Resting HR", "bpm"),
+    ("hrv", "HRV", ""),
+    ("hrvSDNN", "HRV SDNN", ""),
+    ("avgSleepingHR", "Average Sleeping HR", "bpm"),
+    ("spO2", "SpO2", "%"),
+    ("systolic", "Systolic BP", ""),
+    ("diastolic", "Diastolic BP", ""),
+    ("respiration", "Respiration", "breaths/min"),
+    ("bloodGlucose", "Blood Glucose", "mmol/L"),
+    ("lactate", "Lactate", "mmol/L"),
+    ("vo2max", "VO2 Max", "ml/kg/min"),
+    ("bodyFat", "Body Fat", "%"),
+    ("abdomen", "Abdomen", "cm"),
+    ("baevskySI", "Baevsky Stress Index", ""),
+)
+
+_SLEEP_QUALITY_LABELS = {1: "Great", 2: "Good", 3: "Average", 4: "Poor"}
+
+_SUBJECTIVE_FEELINGS_SPEC: tuple[tuple[str, str], ...] = (
+    ("soreness", "Soreness"),
+    ("fatigue", "Fatigue"),
+    ("stress", "Stress"),
+    ("mood", "Mood"),
+    ("motivation", "Motivation"),
+    ("injury", "Injury Level"),
+)
+
+_NUTRITION_HYDRATION_SPEC: tuple[tuple[str, str, str], ...] = (
+    ("kcalConsumed", "Calories Consumed", ""),
+    ("carbohydrates", "Carbohydrates", "g"),
+    ("protein", "Protein", "g"),
+    ("fatTotal", "Fat", "g"),
+    ("hydrationVolume", "Hydration Volume", ""),
+)
+
+
 def _format_training_metrics(entries: dict[str, Any]) -> list[str]:
     """Format training metrics section."""
     training_metrics = []
-    for k, label in [
-        ("ctl", "Fitness (CTL)"),
-        ("atl", "Fatigue (ATL)"),
-        ("rampRate", "Ramp Rate"),
-        ("ctlLoad", "CTL Load"),
-        ("atlLoad", "ATL Load"),
-    ]:
+    for k, label in _TRAINING_METRICS_SPEC:
         if entries.get(k) is not None:
             training_metrics.append(f"- {label}: {entries[k]}")
     return training_metrics
@@ -172,34 +285,22 @@ def _format_training_metrics(entries: dict[str, Any]) -> list[str]:
 
 def _format_sport_info(entries: dict[str, Any]) -> list[str]:
     """Format sport-specific info section."""
+    sport_info = entries.get("sportInfo")
+    if not sport_info:
+        return []
     sport_info_list = []
-    if entries.get("sportInfo"):
-        for sport in entries.get("sportInfo", []):
-            if isinstance(sport, dict) and sport.get("eftp") is not None:
-                sport_info_list.append(f"- {sport.get('type')}: eFTP = {sport['eftp']}")
+    for sport in sport_info:
+        if isinstance(sport, dict):
+            eftp = sport.get("eftp")
+            if eftp is not None:
+                sport_info_list.append(f"- {sport.get('type')}: eFTP = {eftp}")
     return sport_info_list
 
 
 def _format_vital_signs(entries: dict[str, Any]) -> list[str]:
     """Format vital signs section."""
     vital_signs = []
-    for k, label, unit in [
-        ("weight", "Weight", "kg"),
-        ("restingHR", "Resting HR", "bpm"),
-        ("hrv", "HRV", ""),
-        ("hrvSDNN", "HRV SDNN", ""),
-        ("avgSleepingHR", "Average Sleeping HR", "bpm"),
-        ("spO2", "SpO2", "%"),
-        ("systolic", "Systolic BP", ""),
-        ("diastolic", "Diastolic BP", ""),
-        ("respiration", "Respiration", "breaths/min"),
-        ("bloodGlucose", "Blood Glucose", "mmol/L"),
-        ("lactate", "Lactate", "mmol/L"),
-        ("vo2max", "VO2 Max", "ml/kg/min"),
-        ("bodyFat", "Body Fat", "%"),
-        ("abdomen", "Abdomen", "cm"),
-        ("baevskySI", "Baevsky Stress Index", ""),
-    ]:
+    for k, label, unit in _VITAL_SIGNS_SPEC:
         if entries.get(k) is not None:
             value = entries[k]
             if k == "systolic" and entries.get("diastolic") is not None:
@@ -224,8 +325,7 @@ def _format_sleep_recovery(entries: dict[str, Any]) -> list[str]:
 
     if entries.get("sleepQuality") is not None:
         quality_value = entries["sleepQuality"]
-        quality_labels = {1: "Great", 2: "Good", 3: "Average", 4: "Poor"}
-        quality_text = quality_labels.get(quality_value, str(quality_value))
+        quality_text = _SLEEP_QUALITY_LABELS.get(quality_value, str(quality_value))
         sleep_lines.append(f"  Sleep Quality: {quality_value} ({quality_text})")
 
     if entries.get("sleepScore") is not None:
@@ -252,14 +352,7 @@ def _format_menstrual_tracking(entries: dict[str, Any]) -> list[str]:
 def _format_subjective_feelings(entries: dict[str, Any]) -> list[str]:
     """Format subjective feelings section."""
     subjective_lines = []
-    for k, label in [
-        ("soreness", "Soreness"),
-        ("fatigue", "Fatigue"),
-        ("stress", "Stress"),
-        ("mood", "Mood"),
-        ("motivation", "Motivation"),
-        ("injury", "Injury Level"),
-    ]:
+    for k, label in _SUBJECTIVE_FEELINGS_SPEC:
         if entries.get(k) is not None:
             subjective_lines.append(f"  {label}: {entries[k]}/10")
     return subjective_lines
@@ -275,13 +368,7 @@ def _format_nutrition_hydration(entries: dict[str, Any]) -> list[str]:
     wellness records.
     """
     nutrition_lines = []
-    for k, label, unit in [
-        ("kcalConsumed", "Calories Consumed", ""),
-        ("carbohydrates", "Carbohydrates", "g"),
-        ("protein", "Protein", "g"),
-        ("fatTotal", "Fat", "g"),
-        ("hydrationVolume", "Hydration Volume", ""),
-    ]:
+    for k, label, unit in _NUTRITION_HYDRATION_SPEC:
         if entries.get(k) is not None:
             suffix = f" {unit}" if unit else ""
             nutrition_lines.append(f"- {label}: {entries[k]}{suffix}")
@@ -294,9 +381,14 @@ def _format_nutrition_hydration(entries: dict[str, Any]) -> list[str]:
 
 def _format_other_fields(entries: dict[str, Any], known_keys: set[str]) -> list[str]:
     """Format any fields not already handled by the standard formatting sections."""
+    # C-level set difference up front: the common case is that every key was
+    # already covered by a standard section, so bail out without iterating.
+    unknown_keys = entries.keys() - known_keys
+    if not unknown_keys:
+        return []
     other_lines = []
     for key, value in entries.items():
-        if key not in known_keys and value is not None:
+        if key in unknown_keys and value is not None:
             if isinstance(value, (dict, list)):
                 other_lines.append(f"- {key}: {json.dumps(value)}")
             else:
@@ -304,6 +396,19 @@ def _format_other_fields(entries: dict[str, Any], known_keys: set[str]) -> list[
     return other_lines
 
 
+# Section titles and their builders, in output order. format_wellness_entry
+# walks this table instead of repeating the build/check/extend block per section.
+_WELLNESS_SECTIONS: tuple[tuple[str, Callable[[dict[str, Any]], list[str]]], ...] = (
+    ("Training Metrics:", _format_training_metrics),
+    ("Sport-Specific Info:", _format_sport_info),
+    ("Vital Signs:", _format_vital_signs),
+    ("Sleep & Recovery:", _format_sleep_recovery),
+    ("Menstrual Tracking:", _format_menstrual_tracking),
+    ("Subjective Feelings:", _format_subjective_feelings),
+    ("Nutrition & Hydration:", _format_nutrition_hydration),
+)
+
+
 def format_wellness_entry(entries: dict[str, Any], include_all_fields: bool = False) -> str:
     """Format wellness entry data into a readable string.
 
@@ -340,47 +445,12 @@ def format_wellness_entry(entries: dict[str, Any], include_all_fields: bool = Fa
     lines.append(f"Date: {entries.get('id', 'N/A')}")
     lines.append("")
 
-    training_metrics = _format_training_metrics(entries)
-    if training_metrics:
-        lines.append("Training Metrics:")
-        lines.extend(training_metrics)
-        lines.append("")
-
-    sport_info_list = _format_sport_info(entries)
-    if sport_info_list:
-        lines.append("Sport-Specific Info:")
-        lines.extend(sport_info_list)
-        lines.append("")
-
-    vital_signs = _format_vital_signs(entries)
-    if vital_signs:
-        lines.append("Vital Signs:")
-        lines.extend(vital_signs)
-        lines.append("")
-
-    sleep_lines = _format_sleep_recovery(entries)
-    if sleep_lines:
-        lines.append("Sleep & Recovery:")
-        lines.extend(sleep_lines)
-        lines.append("")
-
-    menstrual_lines = _format_menstrual_tracking(entries)
-    if menstrual_lines:
-        lines.append("Menstrual Tracking:")
-        lines.extend(menstrual_lines)
-        lines.append("")
-
-    subjective_lines = _format_subjective_feelings(entries)
-    if subjective_lines:
-        lines.append("Subjective Feelings:")
-        lines.extend(subjective_lines)
-        lines.append("")
-
-    nutrition_lines = _format_nutrition_hydration(entries)
-    if nutrition_lines:
-        lines.append("Nutrition & Hydration:")
-        lines.extend(nutrition_lines)
-        lines.append("")
+    for title, build_section in _WELLNESS_SECTIONS:
+        section_lines = build_section(entries)
+        if section_lines:
+            lines.append(title)
+            lines.extend(section_lines)
+            lines.append("")
 
     if entries.get("steps") is not None:
         lines.append("Activity:")
@@ -468,7 +538,7 @@ def format_activity_message(message: dict[str, Any]) -> str:
     created = message.get("created", "Unknown")
     if isinstance(created, str) and len(created) > 10:
         try:
-            dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(created)
             created = dt.strftime("%Y-%m-%d %H:%M:%S")
         except ValueError:
             pass
@@ -500,6 +570,152 @@ def format_custom_item_details(item: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Block templates for format_intervals. str.format_map resolves every
+# substitution in a single C-level pass per block (instead of the per-field
+# bytecode a big f-string compiles to); the defaults dicts supply the 0/"N/A"
+# fallbacks for keys absent from the API payload.
+_INTERVAL_TEMPLATE = """[{idx}] {label} ({type})
+Duration: {elapsed_time} seconds (moving: {moving_time} seconds)
+Distance: {distance} meters
+Start-End Indices: {start_index}-{end_index}
+
+Power Metrics:
+  Average Power: {average_watts} watts ({average_watts_kg} W/kg)
+  Max Power: {max_watts} watts ({max_watts_kg} W/kg)
+  Weighted Avg Power: {weighted_average_watts} watts
+  Intensity: {intensity}
+  Training Load: {training_load}
+  Joules: {joules}
+  Joules > FTP: {joules_above_ftp}
+  Power Zone: {zone} ({zone_min_watts}-{zone_max_watts} watts)
+  W' Balance: Start {wbal_start}, End {wbal_end}
+  L/R Balance: {avg_lr_balance}
+  Variability: {w5s_variability}
+  Torque: Avg {average_torque}, Min {min_torque}, Max {max_torque}
+
+Heart Rate & Metabolic:
+  Heart Rate: Avg {average_heartrate}, Min {min_heartrate}, Max {max_heartrate} bpm
+  Decoupling: {decoupling}
+  DFA α1: {average_dfa_a1}
+  Respiration: {average_respiration} breaths/min
+  EPOC: {average_epoc}
+  SmO2: {average_smo2}% / {average_smo2_2}%
+  THb: {average_thb} / {average_thb_2}
+
+Speed & Cadence:
+  Speed: Avg {average_speed}, Min {min_speed}, Max {max_speed} m/s
+  GAP: {gap} m/s
+  Cadence: Avg {average_cadence}, Min {min_cadence}, Max {max_cadence} rpm
+  Stride: {average_stride}
+
+Elevation & Environment:
+  Elevation Gain: {total_elevation_gain} meters
+  Altitude: Min {min_altitude}, Max {max_altitude} meters
+  Gradient: {average_gradient}%
+  Temperature: {average_temp}°C (Weather: {average_weather_temp}°C, Feels like: {average_feels_like}°C)
+  Wind: Speed {average_wind_speed} km/h, Gust {average_wind_gust} km/h, Direction {prevailing_wind_deg}°
+  Headwind: {headwind_percent}%, Tailwind: {tailwind_percent}%
+
+"""
+
+_INTERVAL_DEFAULTS: dict[str, Any] = dict.fromkeys(
+    (
+        "elapsed_time",
+        "moving_time",
+        "distance",
+        "start_index",
+        "end_index",
+        "average_watts",
+        "average_watts_kg",
+        "max_watts",
+        "max_watts_kg",
+        "weighted_average_watts",
+        "intensity",
+        "training_load",
+        "joules",
+        "joules_above_ftp",
+        "zone_min_watts",
+        "zone_max_watts",
+        "wbal_start",
+        "wbal_end",
+        "avg_lr_balance",
+        "w5s_variability",
+        "average_torque",
+        "min_torque",
+        "max_torque",
+        "average_heartrate",
+        "min_heartrate",
+        "max_heartrate",
+        "decoupling",
+        "average_dfa_a1",
+        "average_respiration",
+        "average_epoc",
+        "average_smo2",
+        "average_smo2_2",
+        "average_thb",
+        "average_thb_2",
+        "average_speed",
+        "min_speed",
+        "max_speed",
+        "gap",
+        "average_cadence",
+        "min_cadence",
+        "max_cadence",
+        "average_stride",
+        "total_elevation_gain",
+        "min_altitude",
+        "max_altitude",
+        "average_gradient",
+        "average_temp",
+        "average_weather_temp",
+        "average_feels_like",
+        "average_wind_speed",
+        "average_wind_gust",
+        "prevailing_wind_deg",
+        "headwind_percent",
+        "tailwind_percent",
+    ),
+    0,
+)
+_INTERVAL_DEFAULTS["type"] = "Unknown"
+_INTERVAL_DEFAULTS["zone"] = "N/A"
+
+_GROUP_TEMPLATE = """Group: {id} (Contains {count} intervals)
+Duration: {elapsed_time} seconds (moving: {moving_time} seconds)
+Distance: {distance} meters
+Start-End Indices: {start_index}-N/A
+
+Power: Avg {average_watts} watts ({average_watts_kg} W/kg), Max {max_watts} watts
+W. Avg Power: {weighted_average_watts} watts, Intensity: {intensity}
+Heart Rate: Avg {average_heartrate}, Max {max_heartrate} bpm
+Speed: Avg {average_speed}, Max {max_speed} m/s
+Cadence: Avg {average_cadence}, Max {max_cadence} rpm
+
+"""
+
+_GROUP_DEFAULTS: dict[str, Any] = dict.fromkeys(
+    (
+        "count",
+        "elapsed_time",
+        "moving_time",
+        "distance",
+        "start_index",
+        "average_watts",
+        "average_watts_kg",
+        "max_watts",
+        "weighted_average_watts",
+        "intensity",
+        "average_heartrate",
+        "max_heartrate",
+        "average_speed",
+        "max_speed",
+        "average_cadence",
+        "max_cadence",
+    ),
+    0,
+)
+
+
 def format_intervals(intervals_data: dict[str, Any]) -> str:
     """Format intervals data into a readable string with all available fields.
 
@@ -509,82 +725,37 @@ def format_intervals(intervals_data: dict[str, Any]) -> str:
     Returns:
         A formatted string representation of the intervals data
     """
-    # Format basic intervals information
-    result = f"""Intervals Analysis:
+    # Accumulate blocks in a list and join once at the end — appending to a
+    # string inside the loops would re-copy the whole result on every block.
+    parts: list[str] = [
+        f"""Intervals Analysis:
 
 ID: {intervals_data.get("id", "N/A")}
 Analyzed: {intervals_data.get("analyzed", "N/A")}
 
 """
+    ]
 
     # Format individual intervals
     if "icu_intervals" in intervals_data and intervals_data["icu_intervals"]:
-        result += "Individual Intervals:\n\n"
+        parts.append("Individual Intervals:\n\n")
 
         for i, interval in enumerate(intervals_data["icu_intervals"], 1):
-            result += f"""[{i}] {interval.get("label", f"Interval {i}")} ({interval.get("type", "Unknown")})
-Duration: {interval.get("elapsed_time", 0)} seconds (moving: {interval.get("moving_time", 0)} seconds)
-Distance: {interval.get("distance", 0)} meters
-Start-End Indices: {interval.get("start_index", 0)}-{interval.get("end_index", 0)}
-
-Power Metrics:
-  Average Power: {interval.get("average_watts", 0)} watts ({interval.get("average_watts_kg", 0)} W/kg)
-  Max Power: {interval.get("max_watts", 0)} watts ({interval.get("max_watts_kg", 0)} W/kg)
-  Weighted Avg Power: {interval.get("weighted_average_watts", 0)} watts
-  Intensity: {interval.get("intensity", 0)}
-  Training Load: {interval.get("training_load", 0)}
-  Joules: {interval.get("joules", 0)}
-  Joules > FTP: {interval.get("joules_above_ftp", 0)}
-  Power Zone: {interval.get("zone", "N/A")} ({interval.get("zone_min_watts", 0)}-{interval.get("zone_max_watts", 0)} watts)
-  W' Balance: Start {interval.get("wbal_start", 0)}, End {interval.get("wbal_end", 0)}
-  L/R Balance: {interval.get("avg_lr_balance", 0)}
-  Variability: {interval.get("w5s_variability", 0)}
-  Torque: Avg {interval.get("average_torque", 0)}, Min {interval.get("min_torque", 0)}, Max {interval.get("max_torque", 0)}
-
-Heart Rate & Metabolic:
-  Heart Rate: Avg {interval.get("average_heartrate", 0)}, Min {interval.get("min_heartrate", 0)}, Max {interval.get("max_heartrate", 0)} bpm
-  Decoupling: {interval.get("decoupling", 0)}
-  DFA α1: {interval.get("average_dfa_a1", 0)}
-  Respiration: {interval.get("average_respiration", 0)} breaths/min
-  EPOC: {interval.get("average_epoc", 0)}
-  SmO2: {interval.get("average_smo2", 0)}% / {interval.get("average_smo2_2", 0)}%
-  THb: {interval.get("average_thb", 0)} / {interval.get("average_thb_2", 0)}
-
-Speed & Cadence:
-  Speed: Avg {interval.get("average_speed", 0)}, Min {interval.get("min_speed", 0)}, Max {interval.get("max_speed", 0)} m/s
-  GAP: {interval.get("gap", 0)} m/s
-  Cadence: Avg {interval.get("average_cadence", 0)}, Min {interval.get("min_cadence", 0)}, Max {interval.get("max_cadence", 0)} rpm
-  Stride: {interval.get("average_stride", 0)}
-
-Elevation & Environment:
-  Elevation Gain: {interval.get("total_elevation_gain", 0)} meters
-  Altitude: Min {interval.get("min_altitude", 0)}, Max {interval.get("max_altitude", 0)} meters
-  Gradient: {interval.get("average_gradient", 0)}%
-  Temperature: {interval.get("average_temp", 0)}°C (Weather: {interval.get("average_weather_temp", 0)}°C, Feels like: {interval.get("average_feels_like", 0)}°C)
-  Wind: Speed {interval.get("average_wind_speed", 0)} km/h, Gust {interval.get("average_wind_gust", 0)} km/h, Direction {interval.get("prevailing_wind_deg", 0)}°
-  Headwind: {interval.get("headwind_percent", 0)}%, Tailwind: {interval.get("tailwind_percent", 0)}%
-
-"""
+            values = _INTERVAL_DEFAULTS | interval
+            values["idx"] = i
+            values.setdefault("label", f"Interval {i}")
+            parts.append(_INTERVAL_TEMPLATE.format_map(values))
 
     # Format interval groups
     if "icu_groups" in intervals_data and intervals_data["icu_groups"]:
-        result += "Interval Groups:\n\n"
+        parts.append("Interval Groups:\n\n")
 
         for i, group in enumerate(intervals_data["icu_groups"], 1):
-            result += f"""Group: {group.get("id", f"Group {i}")} (Contains {group.get("count", 0)} intervals)
-Duration: {group.get("elapsed_time", 0)} seconds (moving: {group.get("moving_time", 0)} seconds)
-Distance: {group.get("distance", 0)} meters
-Start-End Indices: {group.get("start_index", 0)}-N/A
-
-Power: Avg {group.get("average_watts", 0)} watts ({group.get("average_watts_kg", 0)} W/kg), Max {group.get("max_watts", 0)} watts
-W. Avg Power: {group.get("weighted_average_watts", 0)} watts, Intensity: {group.get("intensity", 0)}
-Heart Rate: Avg {group.get("average_heartrate", 0)}, Max {group.get("max_heartrate", 0)} bpm
-Speed: Avg {group.get("average_speed", 0)}, Max {group.get("max_speed", 0)} m/s
-Cadence: Avg {group.get("average_cadence", 0)}, Max {group.get("max_cadence", 0)} rpm
-
-"""
+            values = _GROUP_DEFAULTS | group
+            values.setdefault("id", f"Group {i}")
+            parts.append(_GROUP_TEMPLATE.format_map(values))
 
-    return result
+    return "".join(parts)
 
 
 def _format_duration_label(secs: int) -> str:
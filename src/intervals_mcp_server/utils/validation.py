@@ -5,10 +5,24 @@ This module contains validation functions for input parameters.
 """
 
 import re
-from datetime import datetime
+from datetime import date
 
 from intervals_mcp_server.utils.dates import parse_date_range
 
+# Precompiled athlete-ID pattern so validate_athlete_id skips the re module's
+# per-call pattern-cache lookup.
+_ATHLETE_ID_RE = re.compile(r"i?\d+")
+
+# Keyword mapping used by resolve_activity_type, hoisted to module scope so the
+# list isn't rebuilt on every call.
+_ACTIVITY_TYPE_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Ride", ("bike", "cycle", "cycling", "ride")),
+    ("Run", ("run", "running", "jog", "jogging")),
+    ("Swim", ("swim", "swimming", "pool")),
+    ("Walk", ("walk", "walking", "hike", "hiking")),
+    ("Row", ("row", "rowing")),
+)
+
 
 def validate_athlete_id(athlete_id: str) -> None:
     """Validate that an athlete ID is in the correct format.
@@ -22,7 +36,7 @@ def validate_athlete_id(athlete_id: str) -> None:
     Raises:
         ValueError: If the athlete ID is not in the correct format.
     """
-    if athlete_id and not re.fullmatch(r"i?\d+", athlete_id):
+    if athlete_id and not _ATHLETE_ID_RE.fullmatch(athlete_id):
         raise ValueError(
             "ATHLETE_ID must be all digits (e.g. 123456) or start with 'i' followed by digits (e.g. i123456)"
         )
@@ -40,8 +54,12 @@ def validate_date(date_str: str) -> str:
     Raises:
         ValueError: If the date string is not in YYYY-MM-DD format.
     """
+    # Shape check first: date.fromisoformat is much faster than strptime but
+    # also accepts other ISO 8601 forms (e.g. YYYYMMDD), which we don't want.
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+        raise ValueError("Invalid date format. Please use YYYY-MM-DD.")
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        date.fromisoformat(date_str)
         return date_str
     except ValueError as exc:
         raise ValueError("Invalid date format. Please use YYYY-MM-DD.") from exc
@@ -87,14 +105,7 @@ def resolve_activity_type(name: str | None, activity_type: str | None = None) ->
     if activity_type:
         return activity_type
     name_lower = name.lower() if name else ""
-    mapping = [
-        ("Ride", ["bike", "cycle", "cycling", "ride"]),
-        ("Run", ["run", "running", "jog", "jogging"]),
-        ("Swim", ["swim", "swimming", "pool"]),
-        ("Walk", ["walk", "walking", "hike", "hiking"]),
-        ("Row", ["row", "rowing"]),
-    ]
-    for workout, keywords in mapping:
+    for workout, keywords in _ACTIVITY_TYPE_KEYWORDS:
         if any(keyword in name_lower for keyword in keywords):
             return workout
     return "Ride"  # Default
@@ -0,0 +1,39 @@
+"""
+Shared pytest fixtures for the test suite.
+
+Fixture files under tests/ressources are loaded once per session so that
+repeated tests (and future parametrizations over the same files) don't pay
+the disk read and JSON decode on every invocation.
+"""
+
+import json
+from pathlib import Path
+
+# In full-tree pylint runs the repo's utils/types.py shadows the stdlib module,
+# so astroid can't see MappingProxyType here even though the import is fine.
+from types import MappingProxyType  # pylint: disable=no-name-in-module
+from typing import Any
+
+import pytest
+
+from tests.sample_data import get_intervals_data
+
+_RESSOURCES_DIR = Path(__file__).parent / "ressources"
+
+
+@pytest.fixture(scope="session")
+def intervals_data() -> MappingProxyType:
+    """Read-only view of the shared intervals analysis sample."""
+    return MappingProxyType(get_intervals_data())
+
+
+@pytest.fixture(scope="session")
+def wellness_entry() -> dict[str, Any]:
+    """Decoded wellness entry sample from tests/ressources/wellness_entry.json."""
+    return json.loads((_RESSOURCES_DIR / "wellness_entry.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def wellness_entry_formatted() -> str:
+    """Expected formatted output from tests/ressources/wellness_entry_formatted.txt."""
+    return (_RESSOURCES_DIR / "wellness_entry_formatted.txt").read_text(encoding="utf-8")
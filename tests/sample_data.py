@@ -2,34 +2,50 @@
 Sample data for testing Intervals.icu MCP server functions.
 
 This module contains test data structures used across the test suite.
+
+The intervals sample is built lazily via ``get_intervals_data()`` and cached,
+so importing this module doesn't pay for the nested-dict construction when the
+tests that use it are deselected.
 """
 
-INTERVALS_DATA = {
-    "id": "i1",
-    "analyzed": True,
-    "icu_intervals": [
-        {
-            "type": "work",
-            "label": "Rep 1",
-            "elapsed_time": 60,
-            "moving_time": 60,
-            "distance": 100,
-            "average_watts": 200,
-            "max_watts": 300,
-            "average_watts_kg": 3.0,
-            "max_watts_kg": 5.0,
-            "weighted_average_watts": 220,
-            "intensity": 0.8,
-            "training_load": 10,
-            "average_heartrate": 150,
-            "max_heartrate": 160,
-            "average_cadence": 90,
-            "max_cadence": 100,
-            "average_speed": 6,
-            "max_speed": 8,
-        }
-    ],
-}
+import functools
+from typing import Any
+
+
+def _build_intervals_data() -> dict[str, Any]:
+    """Construct the intervals analysis sample payload."""
+    return {
+        "id": "i1",
+        "analyzed": True,
+        "icu_intervals": [
+            {
+                "type": "work",
+                "label": "Rep 1",
+                "elapsed_time": 60,
+                "moving_time": 60,
+                "distance": 100,
+                "average_watts": 200,
+                "max_watts": 300,
+                "average_watts_kg": 3.0,
+                "max_watts_kg": 5.0,
+                "weighted_average_watts": 220,
+                "intensity": 0.8,
+                "training_load": 10,
+                "average_heartrate": 150,
+                "max_heartrate": 160,
+                "average_cadence": 90,
+                "max_cadence": 100,
+                "average_speed": 6,
+                "max_speed": 8,
+            }
+        ],
+    }
+
+
+@functools.cache
+def get_intervals_data() -> dict[str, Any]:
+    """Return the shared intervals sample, building it on first use."""
+    return _build_intervals_data()
 
 POWER_CURVES_DATA = {
     "list": [
@@ -4,7 +4,8 @@ Unit tests for formatting utilities in intervals_mcp_server.utils.formatting.
 These tests verify that the formatting functions produce expected output strings for activities, workouts, wellness entries, events, and intervals.
 """
 
-import json
+import pytest
+
 from intervals_mcp_server.utils.formatting import (
     format_activity_summary,
     format_workout,
@@ -14,7 +15,6 @@ from intervals_mcp_server.utils.formatting import (
     format_intervals,
     format_power_curves,
 )
-from tests.sample_data import INTERVALS_DATA
 
 
 def test_format_activity_summary():
@@ -34,6 +34,27 @@ def test_format_activity_summary():
     assert "ID: 1" in result
 
 
+def test_format_activity_summary_skip_missing():
+    """
+    Test that format_activity_summary with skip_missing=True omits lines for absent
+    fields and drops section headers whose lines were all omitted.
+    """
+    data = {
+        "name": "Morning Ride",
+        "id": 1,
+        "distance": 1000,
+        "average_heartrate": 140,
+    }
+    result = format_activity_summary(data, skip_missing=True)
+    assert "Activity: Morning Ride" in result
+    assert "Distance: 1000 meters" in result
+    assert "Average Heart Rate: 140 bpm" in result
+    assert "N/A" not in result
+    # Sections with no data should disappear entirely, header included
+    assert "Power Data:" not in result
+    assert "Gear:" not in result
+
+
 def test_format_workout():
     """
     Test that format_workout returns a string containing the workout name and interval count.
@@ -51,17 +72,13 @@ def test_format_workout():
     assert "Intervals: 3" in result
 
 
-def test_format_wellness_entry():
+@pytest.mark.io
+def test_format_wellness_entry(wellness_entry, wellness_entry_formatted):
     """
     Test that format_wellness_entry returns a string containing the date and fitness (CTL).
     """
-    with open("tests/ressources/wellness_entry.json", "r", encoding="utf-8") as f:
-        entry = json.load(f)
-    result = format_wellness_entry(entry)
-
-    with open("tests/ressources/wellness_entry_formatted.txt", "r", encoding="utf-8") as f:
-        expected_result = f.read()
-    assert result == expected_result
+    result = format_wellness_entry(wellness_entry)
+    assert result == wellness_entry_formatted
 
 
 def test_format_wellness_entry_include_all_fields():
@@ -181,11 +198,11 @@ def test_format_event_details():
     assert "Workout Information:" in details
 
 
-def test_format_intervals():
+def test_format_intervals(intervals_data):
     """
     Test that format_intervals returns a string containing interval analysis and the interval label.
     """
-    result = format_intervals(INTERVALS_DATA)
+    result = format_intervals(intervals_data)
     assert "Intervals Analysis:" in result
     assert "Rep 1" in result
 
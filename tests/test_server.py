@@ -45,7 +45,7 @@ from intervals_mcp_server.server import (  # pylint: disable=wrong-import-positi
     delete_custom_item,
 )
 from intervals_mcp_server.tools import gear as gear_module  # pylint: disable=wrong-import-position
-from tests.sample_data import INTERVALS_DATA, POWER_CURVES_DATA  # pylint: disable=wrong-import-position
+from tests.sample_data import POWER_CURVES_DATA, get_intervals_data  # pylint: disable=wrong-import-position
 
 
 def _reset_gear_cache():
@@ -234,7 +234,7 @@ def test_get_activity_intervals(monkeypatch):
     """
 
     async def fake_request(*_args, **_kwargs):
-        return INTERVALS_DATA
+        return get_intervals_data()
 
     # Patch in both api.client and tools modules to ensure it works
     monkeypatch.setattr("intervals_mcp_server.api.client.make_intervals_request", fake_request)
@@ -12,16 +12,13 @@ import pytest
 from intervals_mcp_server.utils.types import Value, ValueUnits
 
 
-def test_str_percent_ftp():
-    """Test formatting percentage FTP values."""
-    val = Value(value=95.0, units=ValueUnits.PERCENT_FTP)
-    assert str(val) == "95% ftp"
-
-
-def test_str_ramp_percent_ftp():
-    """Test formatting ramp intervals with percentage FTP."""
-    val = Value(start=65, end=85, units=ValueUnits.PERCENT_FTP)
-    assert str(val) == "65%-85% ftp"
+@pytest.mark.parametrize("kwargs,expected", [
+    ({"value": 95.0, "units": ValueUnits.PERCENT_FTP}, "95% ftp"),
+    ({"start": 65, "end": 85, "units": ValueUnits.PERCENT_FTP}, "65%-85% ftp"),
+])
+def test_str_percent_ftp(kwargs, expected):
+    """Test formatting percentage FTP values, both single and ramp intervals."""
+    assert str(Value(**kwargs)) == expected
 
 
 @pytest.mark.parametrize("unit_str,expected_enum", [